@@ -1,28 +1,47 @@
 #!/usr/bin/env python3
-import subprocess
+import asyncio
 import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
+import aiohttp
 import pkg_resources
-import requests
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
-def get_installed_version(package_name: str) -> str:
-    """Get the installed version of a package using pip."""
+_VER_SPLIT = re.compile(r'[><=~]=*')
+
+def _load_installed_once() -> Dict[str, str]:
+    """Map every installed distribution key to its version in one pass."""
+    return {dist.key: dist.version for dist in pkg_resources.working_set}
+
+def _distribution_key(package_name: str) -> str:
+    """Normalize a requirement name (extras included) to a distribution key."""
     try:
-        dist = pkg_resources.get_distribution(package_name)
-        return dist.version
-    except pkg_resources.DistributionNotFound:
-        return "Not installed"
+        return pkg_resources.Requirement.parse(package_name).key
+    except ValueError:
+        return pkg_resources.safe_name(package_name).lower()
 
-def get_latest_version(package_name: str) -> str:
-    """Get the latest version available on PyPI using the JSON API."""
+async def fetch_latest(session: aiohttp.ClientSession, package_name: str) -> Tuple[str, str]:
+    """Fetch the latest PyPI version of a package on a shared aiohttp session."""
     try:
-        response = requests.get(f"https://pypi.org/pypi/{package_name}/json")
-        if response.status_code == 200:
-            return response.json()["info"]["version"]
-        return "Unknown"
+        async with session.get(f"https://pypi.org/pypi/{package_name}/json") as response:
+            if response.status == 200:
+                return package_name, _loads(await response.read())["info"]["version"]
+            return package_name, "Unknown"
     except Exception:
-        return "Unknown"
+        return package_name, "Unknown"
+
+def get_latest_versions(packages: Iterable[str]) -> Dict[str, str]:
+    """Look up the latest PyPI versions of all packages concurrently."""
+    async def run():
+        connector = aiohttp.TCPConnector(limit=32)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return dict(await asyncio.gather(*[fetch_latest(session, p) for p in packages]))
+
+    return asyncio.run(run())
 
 def parse_requirements(filename: str) -> Dict[str, Optional[str]]:
     """Parse requirements.txt and return a dict of package names and versions."""
@@ -31,17 +50,23 @@ def parse_requirements(filename: str) -> Dict[str, Optional[str]]:
         for line in f:
             line = line.strip()
             if line and not line.startswith('#'):
-                parts = re.split(r'[><=~]=*', line)
+                parts = _VER_SPLIT.split(line, maxsplit=1)
                 package = parts[0].strip()
                 version = parts[1].strip() if len(parts) > 1 else None
                 requirements[package] = version
     return requirements
 
-def update_requirements(requirements: Dict[str, Optional[str]], filename: str):
+def update_requirements(
+    requirements: Dict[str, Optional[str]],
+    filename: str,
+    latest_versions: Optional[Dict[str, str]] = None
+):
     """Update requirements.txt with new versions."""
+    if latest_versions is None:
+        latest_versions = get_latest_versions(requirements)
     with open(filename, 'w') as f:
         for package, _ in requirements.items():
-            latest = get_latest_version(package)
+            latest = latest_versions.get(package, "Unknown")
             if latest != "Unknown":
                 f.write(f"{package}>={latest}\n")
             else:
@@ -56,20 +81,22 @@ def main():
     
     print("Checking current dependencies...")
     current_requirements = parse_requirements(requirements_file)
+    latest_versions = get_latest_versions(current_requirements)
     
     print("\nCurrent vs Latest versions:")
     print("-" * 60)
     print(f"{'Package':<30} {'Current':<15} {'Latest':<15}")
     print("-" * 60)
     
+    installed_map = _load_installed_once()
     for package in current_requirements:
-        current = get_installed_version(package)
-        latest = get_latest_version(package)
+        current = installed_map.get(_distribution_key(package), "Not installed")
+        latest = latest_versions[package]
         print(f"{package:<30} {current:<15} {latest:<15}")
     
     update = input("\nWould you like to update requirements.txt with latest versions? (y/n): ")
     if update.lower() == 'y':
-        update_requirements(current_requirements, requirements_file)
+        update_requirements(current_requirements, requirements_file, latest_versions)
         print(f"\nUpdated {requirements_file} with latest versions")
         print("To install updated packages, run: pip install -r requirements.txt")
     else:
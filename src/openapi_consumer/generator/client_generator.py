@@ -1,9 +1,208 @@
-from typing import Dict, Any, List, ForwardRef
+from typing import Dict, Any, List, ForwardRef, Tuple
 import json
+from functools import lru_cache
+from itertools import chain
 from jinja2 import Template
 import re
 
+_HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+
+_TYPE_MAPPING = {
+    'string': 'str',
+    'integer': 'int',
+    'number': 'float',
+    'boolean': 'bool',
+    'array': 'List',
+    'object': 'Dict[str, Any]'
+}
+
+# Source of a single generated client method, filled in with str.format_map.
+# The HTTP method, URL, security schemes and whether a body is sent are
+# written out from the spec; the call itself goes through the client's
+# shared _request helper.
+_METHOD_TEMPLATE = """
+    async def {operation_id}({method_params}) -> {return_type}:
+        \"\"\"
+        {description}
+        \"\"\"
+        return await self._request(
+            "{http_method}",
+            {url},
+            self._headers_for({security_headers}),
+            {query_params},
+            {body}
+        )
+"""
+
+@lru_cache(maxsize=256)
+def _format_path(path: str, names: Tuple[str, ...]) -> str:
+    """
+    Format a path template for use inside the generated f-string URL
+    """
+    return path.format(**{n: '{' + n + '}' for n in names}) if names else path
+
 class ClientGenerator:
+    # Jinja source of the generated client module; subclasses may override it
+    _TEMPLATE_SRC = """
+from typing import Dict, List, Optional, Any, ForwardRef, Tuple, Union
+from pydantic import BaseModel
+import aiohttp
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # fall back to the standard library encoder
+    from json import loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Maximum number of GET responses kept by a client's response cache
+_CACHE_MAXSIZE = 512
+
+# API paths without path parameters; their absolute URLs are built once per client
+_STATIC_PATHS = {{ static_paths }}
+
+@dataclass
+class ApiError(Exception):
+    status_code: int
+    error_data: Dict[str, Any]
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    data = await response.read()
+    return _loads(data) if data else None
+
+def _encode_query_items(items: Any) -> Tuple[Tuple[str, str], ...]:
+    return tuple(
+        (name, _dumps(value).decode() if isinstance(value, (dict, list)) else str(value))
+        for name, value in items
+        if value is not None
+    )
+
+def _dump_body(body: Any) -> bytes:
+    # Models are serialized straight to JSON bytes by pydantic-core, without
+    # an intermediate dict; plain dicts are sent without another validation pass
+    if isinstance(body, BaseModel):
+        return body.__pydantic_serializer__.to_json(body)
+    return _dumps(body)
+
+# Forward references for circular dependencies
+
+{{ forward_refs }}
+
+
+
+{{ schemas }}
+
+
+# Update forward references
+
+{{ forward_ref_updates }}
+
+
+class {{ title }}Client:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        cache_ttl: Optional[float] = None
+    ):
+        self.base_url = base_url.rstrip('/')
+        self._headers: Dict[Tuple[str, ...], CIMultiDictProxy] = {}
+        # Opt-in TTL cache of GET responses, keyed on (url, encoded params)
+        self._cache_ttl = cache_ttl
+        self._cache: "OrderedDict[Tuple[str, Any], Tuple[float, bytes]]" = OrderedDict()
+        self.api_key = api_key
+        self._urls = {path: URL(self.base_url + path) for path in _STATIC_PATHS}
+        self._client = aiohttp.ClientSession(
+            connector=connector or aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=30,
+                ttl_dns_cache=None  # resolve each host once per client
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._client.close()
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]):
+        # Prebuilt headers embed the key, so rebuild them on the next request;
+        # cached responses were fetched with the old credentials, so drop them
+        self._api_key = value
+        self._headers.clear()
+        self._cache.clear()
+
+    def _headers_for(self, schemes: Tuple[str, ...]) -> CIMultiDictProxy:
+        # Request headers are built once per security scheme combination
+        headers = self._headers.get(schemes)
+        if headers is None:
+            headers = CIMultiDict({"Content-Type": "application/json"})
+            if self.api_key:
+                for scheme in schemes:
+                    if scheme == 'bearerAuth':
+                        headers["Authorization"] = f"Bearer {self.api_key}"
+                    elif scheme == 'apiKeyAuth':
+                        headers["X-API-Key"] = self.api_key
+            headers = self._headers[schemes] = CIMultiDictProxy(headers)
+        return headers
+
+    async def _request(self, method: str, url: str, headers: CIMultiDictProxy, params: Any, data: Optional[bytes]) -> Any:
+        caching = self._cache_ttl is not None and method == "GET"
+        if caching:
+            cached = self._cache.get((url, params))
+            if cached is not None and cached[0] > time.monotonic():
+                self._cache.move_to_end((url, params))
+                # Raw bytes are cached and decoded per hit, so callers never
+                # share (and cannot corrupt) the same result object
+                return _loads(cached[1]) if cached[1] else None
+
+        async with self._client.request(
+            method=method,
+            url=self._urls.get(url) or URL(self.base_url + url),
+            headers=headers,
+            params=params,
+            data=data
+        ) as response:
+            if response.status >= 400:
+                error_data = await _read_json(response)
+                raise ApiError(response.status, error_data)
+
+            raw = await response.read() if response.status != 204 else b""
+
+        if caching:
+            self._cache[(url, params)] = (time.monotonic() + self._cache_ttl, raw)
+            if len(self._cache) > _CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+        elif self._cache:
+            self._invalidate(url)
+        return _loads(raw) if raw else None
+
+    def _invalidate(self, url: str):
+        # A write drops every cached read under the same top-level resource
+        root = "/" + url.lstrip("/").split("/", 1)[0]
+        for key in [k for k in self._cache if k[0] == root or k[0].startswith(root + "/")]:
+            del self._cache[key]
+        
+
+{{ methods }}
+
+"""
+
     def __init__(self, spec: Dict[str, Any], package_name: str):
         self.spec = spec
         self.package_name = package_name
@@ -30,8 +229,15 @@ class ClientGenerator:
         return self._render_template(
             title=title,
             version=version,
-            schemas=schemas,
-            methods=methods,
+            forward_refs="\n\n".join(
+                f"{schema['__name__']} = ForwardRef('{schema['__name__']}')" for schema in schemas
+            ),
+            schemas="\n\n".join(schema['code'] for schema in schemas),
+            forward_ref_updates="\n\n".join(
+                f"{schema['__name__']}.update_forward_refs()" for schema in schemas
+            ),
+            methods="\n\n".join(methods),
+            static_paths=repr(tuple(path for path in self.spec.get('paths', {}) if '{' not in path)),
             security_schemes=security_schemes
         )
         
@@ -59,9 +265,9 @@ class ClientGenerator:
                         deps.add(part['$ref'].split('/')[-1])
             dependencies[name] = deps
 
-        # Topologically sort schemas
+        # Topologically sort schemas, generating each one as soon as its
+        # dependencies have been emitted
         processed = set()
-        ordered_schemas = []
 
         def process_schema(name):
             if name in processed:
@@ -70,19 +276,14 @@ class ClientGenerator:
                 if dep in dependencies:  # Only process if it's a schema we need to generate
                     process_schema(dep)
             processed.add(name)
-            ordered_schemas.append(name)
-
-        for name in dependencies:
-            process_schema(name)
-
-        # Generate schemas in dependency order
-        for name in ordered_schemas:
             schema = components[name]
             if 'allOf' in schema:
-                schema_code = self._generate_inherited_model(name, schema)
+                schemas.append(self._generate_inherited_model(name, schema))
             else:
-                schema_code = self._generate_pydantic_model(name, schema)
-            schemas.append(schema_code)
+                schemas.append(self._generate_pydantic_model(name, schema))
+
+        for name in dependencies:
+            process_schema(name)
 
         return schemas
         
@@ -97,7 +298,7 @@ class ClientGenerator:
             path_params = operations.get('parameters', [])
             
             for method, operation in operations.items():
-                if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
+                if method.lower() in _HTTP_METHODS:
                     method_code = self._generate_method(
                         path, method, operation, path_params
                     )
@@ -110,27 +311,29 @@ class ClientGenerator:
         Generate a Pydantic model from a schema definition
         """
         properties = schema.get('properties', {})
-        required = schema.get('required', [])
-        
-        fields = []
-        for prop_name, prop_schema in properties.items():
-            field_type = self._get_python_type(prop_schema)
-            optional = prop_name not in required
-            field = f"    {prop_name}: {field_type}"
-            if optional:
-                field += " = None"
-            fields.append(field)
-            
+        required = frozenset(schema.get('required', []))
+        fields = self._generate_fields(properties, required)
+
         return {
             "__name__": name,
             "code": f"""class {name}(BaseModel):
     \"\"\"
     {schema.get('description', '')}
     \"\"\"
-{chr(10).join(fields)}
+{fields}
 """
         }
 
+    def _generate_fields(self, properties: Dict[str, Any], required: frozenset) -> str:
+        """
+        Generate the field declarations of a Pydantic model
+        """
+        return "\n".join([
+            f"    {prop_name}: {self._get_python_type(prop_schema)}"
+            f"{'' if prop_name in required else ' = None'}"
+            for prop_name, prop_schema in properties.items()
+        ])
+
     def _generate_inherited_model(self, name: str, schema: Dict[str, Any]) -> Dict[str, str]:
         """
         Generate a Pydantic model that inherits from another model
@@ -138,24 +341,16 @@ class ClientGenerator:
         all_of = schema.get('allOf', [])
         parent_ref = next((s.get('$ref', '').split('/')[-1] for s in all_of if '$ref' in s), None)
         additional_props = next((s.get('properties', {}) for s in all_of if 'properties' in s), {})
-        required = next((s.get('required', []) for s in all_of if 'required' in s), [])
-        
-        fields = []
-        for prop_name, prop_schema in additional_props.items():
-            field_type = self._get_python_type(prop_schema)
-            optional = prop_name not in required
-            field = f"    {prop_name}: {field_type}"
-            if optional:
-                field += " = None"
-            fields.append(field)
-            
+        required = frozenset(next((s.get('required', []) for s in all_of if 'required' in s), []))
+        fields = self._generate_fields(additional_props, required)
+
         return {
             "__name__": name,
             "code": f"""class {name}({parent_ref}):
     \"\"\"
     {schema.get('description', '')}
     \"\"\"
-{chr(10).join(fields)}
+{fields}
 """
         }
         
@@ -164,7 +359,11 @@ class ClientGenerator:
         Generate a client method for an API endpoint
         """
         operation_id = operation.get('operationId', f"{method}_{path.replace('/', '_')}")
-        parameters = path_params or [] + operation.get('parameters', [])
+        # An operation-level parameter overrides a path-level one with the same name and location
+        parameters = {
+            (param['name'], param.get('in')): param
+            for param in chain(path_params or (), operation.get('parameters', ()))
+        }.values()
         request_body = operation.get('requestBody', {})
         responses = operation.get('responses', {})
         security = operation.get('security', [])
@@ -193,7 +392,7 @@ class ClientGenerator:
             content_type = list(request_body.get('content', {}).keys())[0]
             schema = request_body['content'][content_type]['schema']
             body_type = self._get_python_type(schema)
-            params.append(f"body: {body_type}")
+            params.append(f"body: Union[{body_type}, Dict[str, Any]]")
             
         # Get response type
         success_response = next((responses[code] for code in ['200', '201'] if code in responses), None)
@@ -205,66 +404,34 @@ class ClientGenerator:
                 return_type = self._get_python_type(schema)
             
         method_params = ', '.join(['self'] + params)
-        url_params = {p: '{' + p + '}' for p in path_param_names}
-        formatted_path = path.format(**url_params) if url_params else path
+        formatted_path = _format_path(path, tuple(path_param_names))
+        url = f'f"{formatted_path}"' if '{' in formatted_path else f'"{formatted_path}"'
             
-        return f"""
-    async def {operation_id}({method_params}) -> {return_type}:
-        \"\"\"
-        {operation.get('description', '')}
-        \"\"\"
-        url = f"{formatted_path}"
-        method = "{method.upper()}"
-        
-        # Prepare request
-        headers = {{"Content-Type": "application/json"}}
-        params = {{}}
-        
-        # Add query parameters
-        {self._generate_query_params(query_params)}
-        
-        # Add security headers
-        {self._generate_security_headers(security)}
-        
-        response = await self._client.request(
-            method=method,
-            url=self.base_url + url,
-            headers=headers,
-            params=params,
-            json=body if 'body' in locals() else None
-        )
-        
-        if response.status >= 400:
-            error_data = await response.json()
-            raise ApiError(response.status, error_data)
-        
-        if response.status != 204:  # No content
-            return await response.json()
-"""
+        return _METHOD_TEMPLATE.format_map({
+            'operation_id': operation_id,
+            'method_params': method_params,
+            'return_type': return_type,
+            'description': operation.get('description', ''),
+            'url': url,
+            'http_method': method.upper(),
+            'query_params': self._generate_query_params(query_params),
+            'security_headers': self._generate_security_headers(security),
+            'body': "_dump_body(body)" if request_body else "None",
+        })
 
     def _get_python_type(self, schema: Dict[str, Any]) -> str:
         """
         Convert OpenAPI types to Python types
         """
         if '$ref' in schema:
-            return schema['$ref'].split('/')[-1]
-            
-        type_mapping = {
-            'string': 'str',
-            'integer': 'int',
-            'number': 'float',
-            'boolean': 'bool',
-            'array': 'List',
-            'object': 'Dict[str, Any]'
-        }
-        
+            return schema['$ref'].rsplit('/', 1)[-1]
+
         schema_type = schema.get('type', 'object')
         if schema_type == 'array':
-            items = schema.get('items', {})
-            item_type = self._get_python_type(items)
+            item_type = self._get_python_type(schema.get('items', {}))
             return f"List[{item_type}]"
-        
-        return type_mapping.get(schema_type, 'Any')
+
+        return _TYPE_MAPPING.get(schema_type, 'Any')
 
     def _get_security_schemes(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -274,83 +441,30 @@ class ClientGenerator:
 
     def _generate_query_params(self, param_names: List[str]) -> str:
         """
-        Generate code to add query parameters
+        Generate the expression that encodes query parameters
         """
         if not param_names:
-            return ""
-            
-        lines = []
-        for param in param_names:
-            lines.append(f"if {param} is not None:")
-            lines.append(f"    if isinstance({param}, (dict, list)):")
-            lines.append(f"        params['{param}'] = json.dumps({param})")
-            lines.append(f"    else:")
-            lines.append(f"        params['{param}'] = str({param})")
-        return "\n        ".join(lines)
+            return "()"
+
+        items = ", ".join(f"('{param}', {param})" for param in param_names)
+        return f"_encode_query_items(({items},))"
 
     def _generate_security_headers(self, security: List[Dict[str, List[str]]]) -> str:
         """
-        Generate code to add security headers
+        Generate the security scheme names used to look up request headers
         """
-        if not security:
-            return ""
-            
-        lines = []
-        for scheme in security:
-            for scheme_name in scheme:
-                if scheme_name == 'bearerAuth':
-                    lines.append('if self.api_key:')
-                    lines.append('    headers["Authorization"] = f"Bearer {self.api_key}"')
-                elif scheme_name == 'apiKeyAuth':
-                    lines.append('if self.api_key:')
-                    lines.append('    headers["X-API-Key"] = self.api_key')
-        return "\n        ".join(lines)
+        return repr(tuple(scheme_name for scheme in security for scheme_name in scheme))
         
     def _render_template(self, **kwargs) -> str:
         """
         Render the client template with the generated code
         """
-        template = """
-from typing import Dict, List, Optional, Any, ForwardRef
-from pydantic import BaseModel
-import aiohttp
-import json
-from dataclasses import dataclass
-
-@dataclass
-class ApiError(Exception):
-    status_code: int
-    error_data: Dict[str, Any]
-
-# Forward references for circular dependencies
-{% for schema in schemas %}
-{{ schema.__name__ }} = ForwardRef('{{ schema.__name__ }}')
-{% endfor %}
+        return type(self)._get_template().render(**kwargs)
 
-{% for schema in schemas %}
-{{ schema.code }}
-{% endfor %}
-
-# Update forward references
-{% for schema in schemas %}
-{{ schema.__name__ }}.update_forward_refs()
-{% endfor %}
-
-class {{ title }}Client:
-    def __init__(self, base_url: str, api_key: Optional[str] = None):
-        self.base_url = base_url.rstrip('/')
-        self.api_key = api_key
-        self._client = aiohttp.ClientSession()
-        
-    async def __aenter__(self):
-        return self
-        
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._client.close()
-        
-{% for method in methods %}
-{{ method }}
-{% endfor %}
-"""
-        template = Template(template)
-        return template.render(**kwargs) 
\ No newline at end of file
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_template(cls) -> Template:
+        """
+        Compile the client template once per class
+        """
+        return Template(cls._TEMPLATE_SRC)
@@ -1,16 +1,20 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Optional
 import yaml
-from openapi_spec_validator import validate_spec
-import tempfile
+try:
+    from yaml import CSafeLoader as SpecLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as SpecLoader
+from openapi_spec_validator import validate_spec as validate_openapi_spec
 import os
 import logging
 from contextlib import asynccontextmanager
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 logger.debug("Starting application...")
@@ -33,7 +37,7 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-@app.post("/generate", response_class=FileResponse)
+@app.post("/generate", response_class=Response)
 async def generate_client(
     spec_file: UploadFile = File(...),
     package_name: Optional[str] = None
@@ -41,37 +45,32 @@ async def generate_client(
     """
     Generate a Python client from an OpenAPI specification file
     """
-    logger.debug(f"Received generate request for package: {package_name}")
+    logger.debug("Received generate request for package: %s", package_name)
     try:
-        # Read and parse the OpenAPI spec
-        content = await spec_file.read()
-        spec = yaml.safe_load(content)
+        # Parse the OpenAPI spec straight from the spooled upload
+        spec = await run_in_threadpool(yaml.load, spec_file.file, SpecLoader)
         logger.debug("Successfully parsed OpenAPI spec")
         
         # Validate the spec
-        validate_spec(spec)
+        await run_in_threadpool(validate_openapi_spec, spec)
         logger.debug("Successfully validated OpenAPI spec")
         
         # Generate the client
         generator = ClientGenerator(spec, package_name or "generated_client")
         logger.debug("Created ClientGenerator instance")
         
-        # Create a temporary file to store the generated code
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.py') as tmp_file:
-            generated_code = generator.generate()
-            logger.debug("Generated client code")
-            tmp_file.write(generated_code.encode())
-            tmp_file.flush()
-            logger.debug(f"Wrote generated code to: {tmp_file.name}")
-            
-            return FileResponse(
-                tmp_file.name,
-                media_type='application/python',
-                filename='generated_client.py'
-            )
+        # Return the generated code directly from memory
+        data = (await run_in_threadpool(generator.generate)).encode()
+        logger.debug("Generated client code")
+        
+        return Response(
+            data,
+            media_type='application/python',
+            headers={"Content-Disposition": 'attachment; filename="generated_client.py"'}
+        )
             
     except Exception as e:
-        logger.error(f"Error generating client: {str(e)}", exc_info=True)
+        logger.error("Error generating client: %s", e, exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
     
 @app.post("/validate", response_model=ValidationResponse)
@@ -81,13 +80,12 @@ async def validate_spec(spec_file: UploadFile = File(...)):
     """
     logger.debug("Received validate request")
     try:
-        content = await spec_file.read()
-        spec = yaml.safe_load(content)
-        validate_spec(spec)
+        spec = await run_in_threadpool(yaml.load, spec_file.file, SpecLoader)
+        await run_in_threadpool(validate_openapi_spec, spec)
         logger.debug("Successfully validated spec")
         return ValidationResponse(is_valid=True, message="Specification is valid")
     except Exception as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         return ValidationResponse(is_valid=False, message=str(e))
 
 if __name__ == "__main__":
@@ -1,58 +1,110 @@
 import asyncio
-from ecommerce_client import ECommerceAPIClient, ProductCreate, Address, OrderCreate, OrderItem, Payment
-
-async def test_client():
-    # Initialize client
-    async with ECommerceAPIClient("http://api.example.com", api_key="test_key") as client:
-        try:
-            # Test listing products
-            products = await client.listProducts(
-                category=["electronics"],
-                price_range={"min": 0, "max": 1000},
-                sort="price_asc",
-                page=1,
-                page_size=10
-            )
-            print("Listed products:", products)
-
-            # Test creating a product
-            new_product = ProductCreate(
-                name="Test Product",
-                description="A test product",
-                price=99.99,
-                category="electronics",
-                tags=["test", "new"],
-                attributes={"color": "black"}
-            )
-            created_product = await client.createProduct(new_product)
-            print("Created product:", created_product)
-
-            # Test creating an order
-            order = OrderCreate(
-                items=[
-                    OrderItem(
-                        product_id=created_product.id,
-                        quantity=1,
-                        price_at_time=99.99
-                    )
-                ],
-                shipping_address=Address(
-                    street="123 Test St",
-                    city="Test City",
-                    state="TS",
-                    country="Test Country",
-                    postal_code="12345"
-                ),
-                payment=Payment(
-                    method="credit_card",
-                    card_token="test_token"
-                )
-            )
-            created_order = await client.createOrder(order)
-            print("Created order:", created_order)
-
-        except Exception as e:
-            print(f"Error occurred: {e}")
+import logging
+import os
+try:
+    import uvloop
+except ImportError:  # fall back to the default asyncio event loop
+    uvloop = None
+from typing import Dict, Optional
+from ecommerce_client import ECommerceAPIClient, ProductCreate
+
+log = logging.getLogger("ecom_client_test")
+
+# One client per event loop, shared by every test run on that loop
+_clients: Dict[asyncio.AbstractEventLoop, ECommerceAPIClient] = {}
+_client_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+async def get_client() -> ECommerceAPIClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        async with _client_locks.setdefault(loop, asyncio.Lock()):
+            client = _clients.get(loop)
+            if client is None:
+                client = ECommerceAPIClient("http://api.example.com", api_key="test_key")
+                _clients[loop] = await client.__aenter__()
+    return client
+
+async def close_client():
+    loop = asyncio.get_running_loop()
+    _client_locks.pop(loop, None)
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.__aexit__(None, None, None)
+
+async def create_product_and_order(client: ECommerceAPIClient):
+    # Test creating a product
+    new_product = ProductCreate.model_construct(
+        name="Test Product",
+        description="A test product",
+        price=99.99,
+        category="electronics",
+        tags=["test", "new"],
+        attributes={"color": "black"}
+    )
+    created_product = await client.createProduct(new_product)
+    log.debug("Created product: %s", created_product)
+
+    # Test creating an order; the payload is sent as a plain dict, with no
+    # model objects built just to be serialized again
+    order = {
+        "items": [
+            {
+                "product_id": created_product["id"],
+                "quantity": 1,
+                "price_at_time": 99.99
+            }
+        ],
+        "shipping_address": {
+            "street": "123 Test St",
+            "city": "Test City",
+            "state": "TS",
+            "country": "Test Country",
+            "postal_code": "12345"
+        },
+        "payment": {
+            "method": "credit_card",
+            "card_token": "test_token"
+        }
+    }
+    return await client.createOrder(order)
+
+async def test_client(client: Optional[ECommerceAPIClient] = None):
+    if client is None:
+        client = await get_client()
+
+    # Listing products is independent of the create chain, so run them
+    # together; a failure in one does not cancel the other
+    products, created_order = await asyncio.gather(
+        client.listProducts(
+            category=["electronics"],
+            price_range={"min": 0, "max": 1000},
+            sort="price_asc",
+            page=1,
+            page_size=10
+        ),
+        create_product_and_order(client),
+        return_exceptions=True
+    )
+
+    if isinstance(products, Exception):
+        log.warning("Listing products failed: %s", products)
+    else:
+        log.debug("Listed products: %s", products)
+
+    if isinstance(created_order, Exception):
+        log.warning("Creating product and order failed: %s", created_order)
+    else:
+        log.debug("Created order: %s", created_order)
+
+async def main():
+    try:
+        await test_client()
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
-    asyncio.run(test_client()) 
\ No newline at end of file
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(main())